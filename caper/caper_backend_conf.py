@@ -1,6 +1,5 @@
 import logging
 import os
-from copy import deepcopy
 
 from autouri import AutoURI
 
@@ -189,20 +188,13 @@ class CaperBackendConf:
             lsf_extra_param:
             lsf_resource_param:
         """
-        self._template = {}
-
-        merge_dict(
-            self._template,
+        stanzas = [
             CromwellBackendCommon(
                 default_backend=default_backend,
                 disable_call_caching=disable_call_caching,
                 max_concurrent_workflows=max_concurrent_workflows,
                 memory_retry_error_keys=memory_retry_error_keys,
             ),
-        )
-
-        merge_dict(
-            self._template,
             CromwellBackendDatabase(
                 db=db,
                 db_timeout=db_timeout,
@@ -218,21 +210,13 @@ class CaperBackendConf:
                 postgresql_db_password=postgresql_db_password,
                 postgresql_db_name=postgresql_db_name,
             ),
-        )
-
-        # local backends
-        merge_dict(
-            self._template,
+            # local backends
             CromwellBackendLocal(
                 local_out_dir=local_out_dir,
                 max_concurrent_tasks=max_concurrent_tasks,
                 soft_glob_output=soft_glob_output,
                 local_hash_strat=local_hash_strat,
             ),
-        )
-
-        merge_dict(
-            self._template,
             CromwellBackendSlurm(
                 local_out_dir=local_out_dir,
                 max_concurrent_tasks=max_concurrent_tasks,
@@ -243,10 +227,6 @@ class CaperBackendConf:
                 slurm_extra_param=slurm_extra_param,
                 slurm_resource_param=slurm_resource_param,
             ),
-        )
-
-        merge_dict(
-            self._template,
             CromwellBackendSge(
                 local_out_dir=local_out_dir,
                 max_concurrent_tasks=max_concurrent_tasks,
@@ -257,10 +237,6 @@ class CaperBackendConf:
                 sge_extra_param=sge_extra_param,
                 sge_resource_param=sge_resource_param,
             ),
-        )
-
-        merge_dict(
-            self._template,
             CromwellBackendPbs(
                 local_out_dir=local_out_dir,
                 max_concurrent_tasks=max_concurrent_tasks,
@@ -270,10 +246,6 @@ class CaperBackendConf:
                 pbs_extra_param=pbs_extra_param,
                 pbs_resource_param=pbs_resource_param,
             ),
-        )
-
-        merge_dict(
-            self._template,
             CromwellBackendLsf(
                 local_out_dir=local_out_dir,
                 max_concurrent_tasks=max_concurrent_tasks,
@@ -283,7 +255,7 @@ class CaperBackendConf:
                 lsf_extra_param=lsf_extra_param,
                 lsf_resource_param=lsf_resource_param,
             ),
-        )
+        ]
 
         # cloud backends
         if gcp_prj and gcp_out_dir:
@@ -298,8 +270,7 @@ class CaperBackendConf:
                         )
                     )
 
-            merge_dict(
-                self._template,
+            stanzas.append(
                 CromwellBackendGcp(
                     max_concurrent_tasks=max_concurrent_tasks,
                     gcp_prj=gcp_prj,
@@ -309,29 +280,58 @@ class CaperBackendConf:
                     use_google_cloud_life_sciences=use_google_cloud_life_sciences,
                     gcp_region=gcp_region,
                     gcp_zones=gcp_zones,
-                ),
+                )
             )
 
         if aws_batch_arn and aws_region and aws_out_dir:
-            merge_dict(
-                self._template,
+            stanzas.append(
                 CromwellBackendAws(
                     max_concurrent_tasks=max_concurrent_tasks,
                     aws_batch_arn=aws_batch_arn,
                     aws_region=aws_region,
                     aws_out_dir=aws_out_dir,
                     call_caching_dup_strat=aws_call_caching_dup_strat,
-                ),
+                )
             )
 
-        # keep these variables for a backend checking later
-        self._sge_pe = sge_pe
-        self._gcp_prj = gcp_prj
-        self._gcp_out_dir = gcp_out_dir
+        self._template = {}
+        for stanza in stanzas:
+            merge_dict(self._template, stanza)
+
+        # check required parameters for each backend here
+        # so that create_file() can simply look up an error for a backend
+        required_params = (
+            (BACKEND_SGE, 'sge-pe (Sun GridEngine parallel environment)', sge_pe),
+            (BACKEND_GCP, 'gcp-prj (Google Cloud Platform project)', gcp_prj),
+            (BACKEND_GCP, 'gcp-out-dir (gs:// output bucket path)', gcp_out_dir),
+            (BACKEND_AWS, 'aws-batch-arn (ARN for AWS Batch)', aws_batch_arn),
+            (BACKEND_AWS, 'aws-region (AWS region)', aws_region),
+            (BACKEND_AWS, 'aws-out-dir (s3:// output bucket path)', aws_out_dir),
+        )
+        self._backend_errors = {}
+        for backend, param, val in required_params:
+            if val is None:
+                # keep the first error only
+                self._backend_errors.setdefault(
+                    backend,
+                    '{param} is required for backend {backend}.'.format(
+                        param=param, backend=backend
+                    ),
+                )
 
-        self._aws_batch_arn = aws_batch_arn
-        self._aws_region = aws_region
-        self._aws_out_dir = aws_out_dir
+        # template is not changed after this point
+        # so it is rendered only once on the first create_file() call
+        self._hocon_str = None
+
+    def _get_hocon_str(self):
+        """Renders template as a HOCON string and caches it."""
+        if self._hocon_str is None:
+            self._hocon_str = str(
+                HOCONString.from_dict(
+                    self._template, include=CaperBackendConf.BACKEND_CONF_INCLUDE
+                )
+            )
+        return self._hocon_str
 
     def create_file(
         self,
@@ -352,48 +352,17 @@ class CaperBackendConf:
             basename:
                 Basename.
         """
-        template = deepcopy(self._template)
-
-        if backend == BACKEND_SGE:
-            if self._sge_pe is None:
-                raise ValueError(
-                    'sge-pe (Sun GridEngine parallel environment) '
-                    'is required for backend sge.'
-                )
-        elif backend == BACKEND_GCP:
-            if self._gcp_prj is None:
-                raise ValueError(
-                    'gcp-prj (Google Cloud Platform project) '
-                    'is required for backend gcp.'
-                )
-            if self._gcp_out_dir is None:
-                raise ValueError(
-                    'gcp-out-dir (gs:// output bucket path) '
-                    'is required for backend gcp.'
-                )
-        elif backend == BACKEND_AWS:
-            if self._aws_batch_arn is None:
-                raise ValueError(
-                    'aws-batch-arn (ARN for AWS Batch) ' 'is required for backend aws.'
-                )
-            if self._aws_region is None:
-                raise ValueError(
-                    'aws-region (AWS region) ' 'is required for backend aws.'
-                )
-            if self._aws_out_dir is None:
-                raise ValueError(
-                    'aws-out-dir (s3:// output bucket path) '
-                    'is required for backend aws.'
-                )
-
-        hocon_s = HOCONString.from_dict(
-            template, include=CaperBackendConf.BACKEND_CONF_INCLUDE
-        )
+        if backend in self._backend_errors:
+            raise ValueError(self._backend_errors[backend])
 
-        if custom_backend_conf is not None:
+        if custom_backend_conf is None:
+            contents = self._get_hocon_str()
+        else:
+            hocon_s = HOCONString(self._get_hocon_str())
             s = AutoURI(custom_backend_conf).read()
-            hocon_s.merge(s, update=True)
+            # merge() returns the merged contents as a plain string
+            contents = hocon_s.merge(s)
 
         final_backend_conf_file = os.path.join(directory, basename)
-        AutoURI(final_backend_conf_file).write(str(hocon_s) + '\n')
+        AutoURI(final_backend_conf_file).write(contents + '\n')
         return final_backend_conf_file
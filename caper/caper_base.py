@@ -2,7 +2,7 @@ import logging
 import os
 from datetime import datetime
 
-from autouri import GCSURI, S3URI, AbsPath, AutoURI
+from autouri import GCSURI, S3URI, AbsPath, AutoURI, URIBase
 
 from .cromwell_backend import BACKEND_AWS, BACKEND_GCP
 
@@ -67,8 +67,10 @@ class CaperBase:
             )
 
         self._local_loc_dir = local_loc_dir
-        self._gcp_loc_dir = gcp_loc_dir
-        self._aws_loc_dir = aws_loc_dir
+        # all other backends use local_loc_dir
+        self._loc_dirs = {BACKEND_GCP: gcp_loc_dir, BACKEND_AWS: aws_loc_dir}
+        # parent directories already made by create_timestamped_work_dir()
+        self._work_dir_parents = set()
 
         self._set_env_gcp_app_credentials(gcp_service_account_key_json)
 
@@ -93,15 +95,27 @@ class CaperBase:
             )
             if env_name in os.environ:
                 auth_file = os.environ[env_name]
-                if not os.path.samefile(auth_file, gcp_service_account_key_json):
+                # compare as strings first to skip stat() calls for the same path
+                if auth_file == gcp_service_account_key_json:
+                    is_same_file = True
+                else:
+                    try:
+                        is_same_file = os.path.samefile(
+                            auth_file, gcp_service_account_key_json
+                        )
+                    except FileNotFoundError:
+                        is_same_file = False
+                if not is_same_file:
                     logger.warning(
-                        'Env var {env} does not match with '
+                        'Env var %s does not match with '
                         'gcp_service_account_key_json. '
-                        'Using application default credentials? '.format(env=env_name)
+                        'Using application default credentials? ',
+                        env_name,
                     )
             logger.debug(
-                'Adding GCP service account key JSON {key} to '
-                'env var {env}'.format(key=gcp_service_account_key_json, env=env_name)
+                'Adding GCP service account key JSON %s to env var %s',
+                gcp_service_account_key_json,
+                env_name,
             )
             os.environ[env_name] = gcp_service_account_key_json
 
@@ -123,7 +137,7 @@ class CaperBase:
 
         Args:
             f:
-                File to be localized.
+                File (path/URI string or AutoURI object) to be localized.
             backend:
                 Backend to localize file f on.
             recursive:
@@ -137,15 +151,10 @@ class CaperBase:
         Returns:
             localized URI.
         """
-        if backend == BACKEND_GCP:
-            loc_prefix = self._gcp_loc_dir
-        elif backend == BACKEND_AWS:
-            loc_prefix = self._aws_loc_dir
-        else:
-            loc_prefix = self._local_loc_dir
-
-        return AutoURI(f).localize_on(
-            loc_prefix, recursive=recursive, make_md5_file=make_md5_file
+        if not isinstance(f, URIBase):
+            f = AutoURI(f)
+        return f.localize_on(
+            self.get_loc_dir(backend), recursive=recursive, make_md5_file=make_md5_file
         )
 
     def localize_on_backend_if_modified(
@@ -159,11 +168,14 @@ class CaperBase:
         We can check if file is modifed or not by looking at their basename.
         Modified localized file has a suffix of the target storage. e.g. .s3.
         """
+        f_uri = AutoURI(f)
         f_loc = self.localize_on_backend(
-            f=f, backend=backend, recursive=recursive, make_md5_file=make_md5_file
+            f=f_uri, backend=backend, recursive=recursive, make_md5_file=make_md5_file
         )
 
-        if AutoURI(f).basename == AutoURI(f_loc).basename:
+        # f_loc is always a local/gs:///s3:// path built by autouri
+        # so os.path.basename() gives the same result as AutoURI(f_loc).basename
+        if f_uri.basename == os.path.basename(f_loc):
             return f
         return f_loc
 
@@ -175,20 +187,28 @@ class CaperBase:
                 Prefix for timstamped directory.
                 Directory name will be self._tmpdir / prefix / timestamp.
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
-        work_dir = os.path.join(self._local_loc_dir, prefix, timestamp)
-        os.makedirs(work_dir, exist_ok=True)
-        logger.info(
-            'Creating a timestamped temporary directory. {d}'.format(d=work_dir)
-        )
+        parent = os.path.join(self._local_loc_dir, prefix)
+        if parent not in self._work_dir_parents:
+            os.makedirs(parent, exist_ok=True)
+            self._work_dir_parents.add(parent)
+
+        # retry with a new timestamp if another call has already taken the
+        # directory, so that each call gets its own directory
+        while True:
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+            work_dir = os.path.join(parent, timestamp)
+            try:
+                os.mkdir(work_dir)
+                break
+            except FileExistsError:
+                continue
+            except FileNotFoundError:
+                # parent has been removed after it was made
+                os.makedirs(parent, exist_ok=True)
+        logger.info('Creating a timestamped temporary directory. %s', work_dir)
 
         return work_dir
 
     def get_loc_dir(self, backend):
         """Get localization directory for a backend."""
-        if backend == BACKEND_GCP:
-            return self._gcp_loc_dir
-        elif backend == BACKEND_AWS:
-            return self._aws_loc_dir
-        else:
-            return self._local_loc_dir
+        return self._loc_dirs.get(backend, self._local_loc_dir)
@@ -1,4 +1,6 @@
 import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 from .cromwell import Cromwell
 from .cromwell_backend import (
@@ -133,6 +135,29 @@ max-retries=1
     + CONF_CONTENTS_TMP_DIR
 )
 
+DEFAULT_CONF_CONTENTS = {
+    BACKEND_LOCAL: DEFAULT_CONF_CONTENTS_LOCAL,
+    BACKEND_ALIAS_LOCAL: DEFAULT_CONF_CONTENTS_LOCAL,
+    BACKEND_SLURM: DEFAULT_CONF_CONTENTS_SLURM,
+    BACKEND_SGE: DEFAULT_CONF_CONTENTS_SGE,
+    BACKEND_PBS: DEFAULT_CONF_CONTENTS_PBS,
+    BACKEND_LSF: DEFAULT_CONF_CONTENTS_LSF,
+    BACKEND_GCP: DEFAULT_CONF_CONTENTS_GCP,
+    BACKEND_AWS: DEFAULT_CONF_CONTENTS_AWS,
+}
+
+
+def get_file_mode(path):
+    """Mode of an existing file or default mode of a new file
+    (i.e. 0o666 masked by umask) since tempfile.mkstemp() makes a file
+    readable/writable by the owner only.
+    """
+    if os.path.exists(path):
+        return os.stat(path).st_mode & 0o777
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
 
 def init_caper_conf(conf_file, backend):
     """Initialize conf file for a given backend.
@@ -141,31 +166,31 @@ def init_caper_conf(conf_file, backend):
     Also, download/install Cromwell/Womtool JARs, whose
     default URL and install dir are defined in class Cromwell.
     """
-    if backend in (BACKEND_LOCAL, BACKEND_ALIAS_LOCAL):
-        contents = DEFAULT_CONF_CONTENTS_LOCAL
-    elif backend == BACKEND_SLURM:
-        contents = DEFAULT_CONF_CONTENTS_SLURM
-    elif backend == BACKEND_SGE:
-        contents = DEFAULT_CONF_CONTENTS_SGE
-    elif backend == BACKEND_PBS:
-        contents = DEFAULT_CONF_CONTENTS_PBS
-    elif backend == BACKEND_LSF:
-        contents = DEFAULT_CONF_CONTENTS_LSF
-    elif backend in BACKEND_GCP:
-        contents = DEFAULT_CONF_CONTENTS_GCP
-    elif backend in BACKEND_AWS:
-        contents = DEFAULT_CONF_CONTENTS_AWS
-    else:
+    if backend not in DEFAULT_CONF_CONTENTS:
         raise ValueError('Unsupported backend {p}'.format(p=backend))
-
-    conf_file = os.path.expanduser(conf_file)
-    os.makedirs(os.path.dirname(conf_file), exist_ok=True)
-
-    with open(conf_file, 'w') as fp:
-        fp.write(contents + '\n')
-
-        cromwell = Cromwell()
-        fp.write(
-            '{key}={val}\n'.format(key='cromwell', val=cromwell.install_cromwell())
-        )
-        fp.write('{key}={val}\n'.format(key='womtool', val=cromwell.install_womtool()))
+    contents = DEFAULT_CONF_CONTENTS[backend]
+
+    # JARs are independent of each other, so download them concurrently
+    cromwell = Cromwell()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        future_cromwell = executor.submit(cromwell.install_cromwell)
+        future_womtool = executor.submit(cromwell.install_womtool)
+    contents += '\n{key}={val}\n'.format(key='cromwell', val=future_cromwell.result())
+    contents += '{key}={val}\n'.format(key='womtool', val=future_womtool.result())
+
+    # resolve symlinks to replace the actual file instead of the link itself
+    conf_file = os.path.realpath(os.path.expanduser(conf_file))
+    conf_dir = os.path.dirname(conf_file)
+    os.makedirs(conf_dir, exist_ok=True)
+
+    # write on a temporary file first and then replace the original one
+    # so that an existing conf file is never left partially written
+    fd, tmp_conf_file = tempfile.mkstemp(dir=conf_dir)
+    try:
+        with os.fdopen(fd, 'w') as fp:
+            fp.write(contents)
+        os.chmod(tmp_conf_file, get_file_mode(conf_file))
+        os.replace(tmp_conf_file, conf_file)
+    except BaseException:
+        os.remove(tmp_conf_file)
+        raise
@@ -1,4 +1,3 @@
-import copy
 import json
 import logging
 import os
@@ -13,7 +12,7 @@ from .cromwell_backend import (
     ENVIRONMENT_DOCKER,
     ENVIRONMENT_SINGULARITY,
 )
-from .dict_tool import merge_dict
+from .dict_tool import clone_dict, merge_dict
 from .singularity import find_bindpath
 
 logger = logging.getLogger(__name__)
@@ -92,7 +91,7 @@ class CaperWorkflowOpts:
                 Extra parameters for LSF.
                 This will be appended to "bsub" command line.
         """
-        self._template = {CaperWorkflowOpts.DEFAULT_RUNTIME_ATTRIBUTES: dict()}
+        self._template = {CaperWorkflowOpts.DEFAULT_RUNTIME_ATTRIBUTES: {}}
         default_runtime_attributes = self._template[
             CaperWorkflowOpts.DEFAULT_RUNTIME_ATTRIBUTES
         ]
@@ -188,7 +187,7 @@ class CaperWorkflowOpts:
         if singularity and docker:
             raise ValueError('Cannot use both Singularity and Docker.')
 
-        template = copy.deepcopy(self._template)
+        template = clone_dict(self._template)
         default_runtime_attributes = template[
             CaperWorkflowOpts.DEFAULT_RUNTIME_ATTRIBUTES
         ]
@@ -16,11 +16,7 @@ from .caper_init import init_caper_conf
 from .caper_labels import CaperLabels
 from .caper_runner import CaperRunner
 from .cli_hpc import subcmd_hpc
-from .cromwell_backend import (
-    BACKEND_ALIAS_LOCAL,
-    BACKEND_LOCAL,
-    CromwellBackendDatabase,
-)
+from .cromwell_backend import BACKEND_ALIASES, CromwellBackendDatabase
 from .cromwell_metadata import CromwellMetadata
 from .dict_tool import flatten_dict
 from .resource_analysis import LinearResourceAnalysis
@@ -53,6 +49,9 @@ def get_abspath(path):
     Do not use this function for other non-local-path strings (e.g. --docker).
     """
     if path:
+        # skip URI class dispatching for paths that are already absolute
+        if os.path.isabs(path):
+            return path
         if not AutoURI(path).is_valid:
             return os.path.abspath(os.path.expanduser(path))
     return path
@@ -91,45 +90,27 @@ def init_autouri(args):
 
 
 def check_flags(args):
-    singularity_flag = False
-    docker_flag = False
-    conda_flag = False
-
-    if hasattr(args, 'singularity') and args.singularity is not None:
-        singularity_flag = True
-        if args.singularity.endswith(('.wdl', '.cwl')):
+    flags = []
+    for flag in ('singularity', 'docker', 'conda'):
+        val = getattr(args, flag, None)
+        if val is None:
+            continue
+        flags.append(flag)
+        if val.endswith(('.wdl', '.cwl')):
             raise ValueError(
-                '--singularity ate up positional arguments (e.g. WDL, CWL). '
-                'Define --singularity at the end of command line arguments. '
-                'singularity={p}'.format(p=args.singularity)
+                '--{flag} ate up positional arguments (e.g. WDL, CWL). '
+                'Define --{flag} at the end of command line arguments. '
+                '{flag}={p}'.format(flag=flag, p=val)
             )
 
-    if hasattr(args, 'docker') and args.docker is not None:
-        docker_flag = True
-        if args.docker.endswith(('.wdl', '.cwl')):
-            raise ValueError(
-                '--docker ate up positional arguments (e.g. WDL, CWL). '
-                'Define --docker at the end of command line arguments. '
-                'docker={p}'.format(p=args.docker)
-            )
-        if hasattr(args, 'soft_glob_output') and args.soft_glob_output:
-            raise ValueError(
-                '--soft-glob-output and --docker are mutually exclusive. '
-                'Delocalization from docker container will fail '
-                'for soft-linked globbed outputs.'
-            )
-
-    if hasattr(args, 'conda') and args.conda is not None:
-        conda_flag = True
-        if args.conda.endswith(('.wdl', '.cwl')):
-            raise ValueError(
-                '--conda ate up positional arguments (e.g. WDL, CWL). '
-                'Define --conda at the end of command line arguments. '
-                'conda={p}'.format(p=args.conda)
-            )
+    if 'docker' in flags and getattr(args, 'soft_glob_output', False):
+        raise ValueError(
+            '--soft-glob-output and --docker are mutually exclusive. '
+            'Delocalization from docker container will fail '
+            'for soft-linked globbed outputs.'
+        )
 
-    all_flags = (docker_flag, singularity_flag, conda_flag)
-    if len([flag for flag in all_flags if flag]) > 1:
+    if len(flags) > 1:
         raise ValueError('--docker, --singularity and --conda are mutually exclusive.')
 
 
@@ -180,13 +161,12 @@ def check_db_path(args):
 
 
 def check_backend(args):
-    """Check if local backend is in lower cases.
-    "Local" should be capitalized. i.e. local -> Local.
-    BACKEND_LOCAL is Local.
-    BACKEND_ALIAS_LOCAL is local.
+    """Replace backend alias with an actual backend name.
+    e.g. "Local" should be capitalized. i.e. local -> Local.
+    See BACKEND_ALIASES for all aliases.
     """
-    if hasattr(args, 'backend') and args.backend == BACKEND_ALIAS_LOCAL:
-        args.backend = BACKEND_LOCAL
+    if hasattr(args, 'backend') and args.backend in BACKEND_ALIASES:
+        args.backend = BACKEND_ALIASES[args.backend]
 
 
 def runner(args, nonblocking_server=False):
@@ -1,10 +1,9 @@
 import json
 import logging
 from collections import UserDict
-from copy import deepcopy
 from textwrap import dedent
 
-from .dict_tool import merge_dict
+from .dict_tool import clone_dict, merge_dict
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +18,9 @@ BACKEND_PBS = 'pbs'
 BACKEND_LSF = 'lsf'
 DEFAULT_BACKEND = BACKEND_LOCAL
 
+# alias -> actual backend name
+BACKEND_ALIASES = {BACKEND_ALIAS_LOCAL: BACKEND_LOCAL}
+
 ENVIRONMENT_DOCKER = 'docker'
 ENVIRONMENT_SINGULARITY = 'singularity'
 ENVIRONMENT_CONDA = 'conda'
@@ -89,7 +91,7 @@ class CromwellBackendCommon(UserDict):
                 See https://cromwell.readthedocs.io/en/develop/cromwell_features/RetryWithMoreMemory
                 for details.
         """
-        super().__init__(deepcopy(CromwellBackendCommon.TEMPLATE))
+        super().__init__(clone_dict(CromwellBackendCommon.TEMPLATE))
 
         if default_backend is None:
             default_backend = DEFAULT_BACKEND
@@ -112,7 +114,7 @@ class CromwellBackendServer(UserDict):
     DEFAULT_SERVER_PORT = 8000
 
     def __init__(self, server_port=DEFAULT_SERVER_PORT):
-        super().__init__(deepcopy(CromwellBackendServer.TEMPLATE))
+        super().__init__(clone_dict(CromwellBackendServer.TEMPLATE))
 
         self['webservice']['port'] = server_port
 
@@ -176,7 +178,7 @@ class CromwellBackendDatabase(UserDict):
         postgresql_db_name=DEFAULT_POSTGRESQL_DB_NAME,
         file_db=None,
     ):
-        super().__init__(deepcopy(CromwellBackendDatabase.TEMPLATE))
+        super().__init__(clone_dict(CromwellBackendDatabase.TEMPLATE))
 
         database = self['database']
         db_obj = database['db']
@@ -195,22 +197,32 @@ class CromwellBackendDatabase(UserDict):
 
         elif db == CromwellBackendDatabase.DB_MYSQL:
             database['profile'] = CromwellBackendDatabase.PROFILE_MYSQL
-            db_obj['driver'] = CromwellBackendDatabase.JDBC_DRIVER_MYSQL
-            db_obj['url'] = CromwellBackendDatabase.JDBC_URL_MYSQL.format(
-                ip=mysql_db_ip, port=mysql_db_port, name=mysql_db_name
+            db_obj.update(
+                {
+                    'driver': CromwellBackendDatabase.JDBC_DRIVER_MYSQL,
+                    'url': CromwellBackendDatabase.JDBC_URL_MYSQL.format(
+                        ip=mysql_db_ip, port=mysql_db_port, name=mysql_db_name
+                    ),
+                    'user': mysql_db_user,
+                    'password': mysql_db_password,
+                }
             )
-            db_obj['user'] = mysql_db_user
-            db_obj['password'] = mysql_db_password
 
         elif db == CromwellBackendDatabase.DB_POSTGRESQL:
             database['profile'] = CromwellBackendDatabase.PROFILE_POSTGRESQL
-            db_obj['driver'] = CromwellBackendDatabase.JDBC_DRIVER_POSTGRESQL
-            db_obj['url'] = CromwellBackendDatabase.JDBC_URL_POSTGRESQL.format(
-                ip=postgresql_db_ip, port=postgresql_db_port, name=postgresql_db_name
+            db_obj.update(
+                {
+                    'driver': CromwellBackendDatabase.JDBC_DRIVER_POSTGRESQL,
+                    'url': CromwellBackendDatabase.JDBC_URL_POSTGRESQL.format(
+                        ip=postgresql_db_ip,
+                        port=postgresql_db_port,
+                        name=postgresql_db_name,
+                    ),
+                    'port': postgresql_db_port,
+                    'user': postgresql_db_user,
+                    'password': postgresql_db_password,
+                }
             )
-            db_obj['port'] = postgresql_db_port
-            db_obj['user'] = postgresql_db_user
-            db_obj['password'] = postgresql_db_password
 
         else:
             raise ValueError('Unsupported DB type {db}'.format(db=db))
@@ -247,7 +259,7 @@ class CromwellBackendBase(UserDict):
                 Call-caching strategy string.
                 This can be either a strategy or a list of strategies.
         """
-        super().__init__(deepcopy(CromwellBackendBase.TEMPLATE))
+        super().__init__(clone_dict(CromwellBackendBase.TEMPLATE))
 
         if backend_name is None:
             raise ValueError('backend_name must be provided.')
@@ -272,10 +284,10 @@ class CromwellBackendBase(UserDict):
 
     @backend.setter
     def backend(self, backend):
-        self['backend']['providers'][self._backend_name] = deepcopy(backend)
+        self['backend']['providers'][self._backend_name] = clone_dict(backend)
 
     def merge_backend(self, backend):
-        merge_dict(self.backend, backend)
+        merge_dict(self.backend, clone_dict(backend))
 
     @property
     def backend_config(self):
@@ -340,6 +352,10 @@ class CromwellBackendGcp(CromwellBackendBase):
                 List of zones for Genomics API.
                 Ignored if use_google_cloud_life_sciences.
         """
+        if not gcp_out_dir.startswith('gs://'):
+            raise ValueError(
+                'Wrong GCS bucket URI for gcp_out_dir: {v}'.format(v=gcp_out_dir)
+            )
         if call_caching_dup_strat not in (
             CALL_CACHING_DUP_STRAT_REFERENCE,
             CALL_CACHING_DUP_STRAT_COPY,
@@ -356,7 +372,7 @@ class CromwellBackendGcp(CromwellBackendBase):
             filesystem_name=FILESYSTEM_GCS,
             call_caching_dup_strat=call_caching_dup_strat,
         )
-        merge_dict(self.data, CromwellBackendGcp.TEMPLATE)
+        merge_dict(self.data, clone_dict(CromwellBackendGcp.TEMPLATE))
         self.merge_backend(CromwellBackendGcp.TEMPLATE_BACKEND)
 
         config = self.backend_config
@@ -400,11 +416,6 @@ class CromwellBackendGcp(CromwellBackendBase):
 
         config['project'] = gcp_prj
         self['engine']['filesystems'][FILESYSTEM_GCS]['project'] = gcp_prj
-
-        if not gcp_out_dir.startswith('gs://'):
-            raise ValueError(
-                'Wrong GCS bucket URI for gcp_out_dir: {v}'.format(v=gcp_out_dir)
-            )
         config['root'] = gcp_out_dir
 
 
@@ -436,6 +447,10 @@ class CromwellBackendAws(CromwellBackendBase):
         max_concurrent_tasks=CromwellBackendBase.DEFAULT_CONCURRENT_JOB_LIMIT,
         call_caching_dup_strat=DEFAULT_CALL_CACHING_DUP_STRAT,
     ):
+        if not aws_out_dir.startswith('s3://'):
+            raise ValueError(
+                'Wrong S3 bucket URI for aws_out_dir: {v}'.format(v=aws_out_dir)
+            )
         if call_caching_dup_strat not in (
             CALL_CACHING_DUP_STRAT_REFERENCE,
             CALL_CACHING_DUP_STRAT_COPY,
@@ -465,17 +480,13 @@ class CromwellBackendAws(CromwellBackendBase):
             filesystem_name=FILESYSTEM_S3,
             call_caching_dup_strat=call_caching_dup_strat,
         )
-        merge_dict(self.data, CromwellBackendAws.TEMPLATE)
+        merge_dict(self.data, clone_dict(CromwellBackendAws.TEMPLATE))
         self.merge_backend(CromwellBackendAws.TEMPLATE_BACKEND)
 
         aws = self[BACKEND_AWS]
         aws['region'] = aws_region
 
         config = self.backend_config
-        if not aws_out_dir.startswith('s3://'):
-            raise ValueError(
-                'Wrong S3 bucket URI for aws_out_dir: {v}'.format(v=aws_out_dir)
-            )
         config['root'] = aws_out_dir
         self.default_runtime_attributes['scriptBucketName'] = get_s3_bucket_name(
             aws_out_dir
@@ -106,6 +106,9 @@ class CromwellRestAPI:
         self._password = password
         self.__init_auth()
 
+        # reuse connections to Cromwell server for multiple requests
+        self._session = requests.Session()
+
     def submit(
         self,
         source,
@@ -510,7 +513,7 @@ class CromwellRestAPI:
             CromwellRestAPI.QUERY_URL.format(hostname=self._hostname, port=self._port)
             + endpoint
         )
-        resp = requests.get(
+        resp = self._session.get(
             url, auth=self._auth, params=params, headers={'accept': 'application/json'}
         )
         resp.raise_for_status()
@@ -527,7 +530,7 @@ class CromwellRestAPI:
             CromwellRestAPI.QUERY_URL.format(hostname=self._hostname, port=self._port)
             + endpoint
         )
-        resp = requests.post(
+        resp = self._session.post(
             url, files=manifest, auth=self._auth, headers={'accept': 'application/json'}
         )
         resp.raise_for_status()
@@ -544,7 +547,7 @@ class CromwellRestAPI:
             CromwellRestAPI.QUERY_URL.format(hostname=self._hostname, port=self._port)
             + endpoint
         )
-        resp = requests.patch(
+        resp = self._session.patch(
             url,
             data=data,
             auth=self._auth,
@@ -16,17 +16,27 @@ class WDLParser:
     BASENAME_IMPORTS = 'imports.zip'
 
     def __init__(self, wdl):
-        """Wraps miniwdl's parse_document()."""
+        """Wraps miniwdl's parse_document().
+        WDL is parsed on the first access to its workflow meta or imports.
+        Many callers only need WDL's contents (e.g. regex-based lookups).
+        """
         u = AutoURI(wdl)
         if not u.exists:
             raise FileNotFoundError('WDL does not exist: wdl={wdl}'.format(wdl=wdl))
         self._wdl = wdl
-        self._wdl_contents = AutoURI(wdl).read()
-        try:
-            self._wdl_doc = parse_document(self._wdl_contents)
-        except Exception:
-            logger.error('Failed to parse WDL with miniwdl.')
-            self._wdl_doc = None
+        self._wdl_contents = u.read()
+        self._is_parsed = False
+        self.__wdl_doc = None
+
+    @property
+    def _wdl_doc(self):
+        if not self._is_parsed:
+            self._is_parsed = True
+            try:
+                self.__wdl_doc = parse_document(self._wdl_contents)
+            except Exception:
+                logger.error('Failed to parse WDL with miniwdl.')
+        return self.__wdl_doc
 
     @property
     def contents(self):
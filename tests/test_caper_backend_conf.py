@@ -0,0 +1,69 @@
+from textwrap import dedent
+
+import pytest
+
+from caper.caper_backend_conf import CaperBackendConf
+from caper.cromwell_backend import BACKEND_GCP, BACKEND_LOCAL, BACKEND_SGE
+from caper.hocon_string import HOCONString
+
+
+def test_create_file(tmp_path):
+    """Test if the same backend conf is written for multiple calls and
+    if a custom backend conf is merged into it.
+    """
+    local_out_dir = str(tmp_path / 'out')
+    cbc = CaperBackendConf(
+        default_backend=BACKEND_LOCAL, local_out_dir=local_out_dir, sge_pe='my_pe'
+    )
+
+    dir1 = tmp_path / 'dir1'
+    dir1.mkdir()
+    dir2 = tmp_path / 'dir2'
+    dir2.mkdir()
+    f1 = cbc.create_file(directory=str(dir1), backend=BACKEND_LOCAL)
+    f2 = cbc.create_file(directory=str(dir2), backend=BACKEND_SGE)
+
+    contents = (dir1 / CaperBackendConf.BASENAME_BACKEND_CONF).read_text()
+    assert f1 == str(dir1 / CaperBackendConf.BASENAME_BACKEND_CONF)
+    assert contents.startswith(CaperBackendConf.BACKEND_CONF_INCLUDE)
+    assert contents.endswith('\n')
+    assert open(f2).read() == contents
+
+    d = HOCONString(contents).to_dict(with_include=False)
+    assert d['backend']['default'] == BACKEND_LOCAL
+    assert d['backend']['providers'][BACKEND_LOCAL]['config']['root'] == local_out_dir
+
+    custom_backend_conf = tmp_path / 'my_backend.conf'
+    custom_backend_conf.write_text(
+        dedent(
+            """\
+        backend {
+          default = "sge"
+        }
+        """
+        )
+    )
+    dir3 = tmp_path / 'dir3'
+    dir3.mkdir()
+    f3 = cbc.create_file(
+        directory=str(dir3),
+        backend=BACKEND_SGE,
+        custom_backend_conf=str(custom_backend_conf),
+        basename='my_backend.conf',
+    )
+    contents3 = open(f3).read()
+    assert contents3.startswith(CaperBackendConf.BACKEND_CONF_INCLUDE)
+
+    d3 = HOCONString(contents3).to_dict(with_include=False)
+    assert d3['backend']['default'] == BACKEND_SGE
+    assert d3['backend']['providers'] == d['backend']['providers']
+
+
+def test_create_file_missing_params(tmp_path):
+    cbc = CaperBackendConf(
+        default_backend=BACKEND_LOCAL, local_out_dir=str(tmp_path / 'out')
+    )
+    with pytest.raises(ValueError):
+        cbc.create_file(directory=str(tmp_path), backend=BACKEND_SGE)
+    with pytest.raises(ValueError):
+        cbc.create_file(directory=str(tmp_path), backend=BACKEND_GCP)
@@ -0,0 +1,93 @@
+import os
+from datetime import datetime
+
+from caper import caper_base
+from caper.caper_base import CaperBase
+from caper.cromwell_backend import BACKEND_AWS, BACKEND_GCP, BACKEND_LOCAL
+
+
+def test_get_loc_dir(tmp_path):
+    local_loc_dir = str(tmp_path / 'loc')
+    cb = CaperBase(
+        local_loc_dir=local_loc_dir,
+        gcp_loc_dir='gs://test/loc',
+        aws_loc_dir='s3://test/loc',
+    )
+    assert cb.get_loc_dir(BACKEND_GCP) == 'gs://test/loc'
+    assert cb.get_loc_dir(BACKEND_AWS) == 's3://test/loc'
+    assert cb.get_loc_dir(BACKEND_LOCAL) == local_loc_dir
+    assert cb.get_loc_dir('slurm') == local_loc_dir
+
+    cb = CaperBase(local_loc_dir=local_loc_dir)
+    assert cb.get_loc_dir(BACKEND_GCP) is None
+
+
+def test_set_env_gcp_app_credentials(tmp_path, monkeypatch):
+    env_name = CaperBase.ENV_GOOGLE_APPLICATION_CREDENTIALS
+    key_json = tmp_path / 'key.json'
+    key_json.write_text('{}')
+
+    # env var pointing to a missing file should not crash
+    monkeypatch.setenv(env_name, str(tmp_path / 'not_existing.json'))
+    CaperBase(
+        local_loc_dir=str(tmp_path / 'loc'), gcp_service_account_key_json=str(key_json)
+    )
+    assert os.environ[env_name] == str(key_json)
+
+    # env var with the same path
+    CaperBase(
+        local_loc_dir=str(tmp_path / 'loc'), gcp_service_account_key_json=str(key_json)
+    )
+    assert os.environ[env_name] == str(key_json)
+
+
+def test_create_timestamped_work_dir(tmp_path):
+    cb = CaperBase(local_loc_dir=str(tmp_path / 'loc'))
+
+    work_dir1 = cb.create_timestamped_work_dir(prefix='a/b')
+    work_dir2 = cb.create_timestamped_work_dir(prefix='a/b')
+    assert os.path.isdir(work_dir1)
+    assert os.path.isdir(work_dir2)
+    assert work_dir1 != work_dir2
+    assert os.path.dirname(work_dir1) == str(tmp_path / 'loc' / 'a' / 'b')
+
+    # parent removed after it was made
+    os.rmdir(work_dir1)
+    os.rmdir(work_dir2)
+    os.rmdir(str(tmp_path / 'loc' / 'a' / 'b'))
+    assert os.path.isdir(cb.create_timestamped_work_dir(prefix='a/b'))
+
+
+def test_localize_on_backend_if_modified(tmp_path):
+    cb = CaperBase(local_loc_dir=str(tmp_path / 'loc'))
+
+    f = tmp_path / 'a.txt'
+    f.write_text('a')
+    j = tmp_path / 'b.json'
+    j.write_text('{{"x": "{f}"}}'.format(f=str(f)))
+
+    # same storage and not modified, so original files are returned
+    assert cb.localize_on_backend_if_modified(str(f), BACKEND_LOCAL) == str(f)
+    assert cb.localize_on_backend_if_modified(
+        str(j), BACKEND_LOCAL, recursive=True
+    ) == str(j)
+
+
+def test_create_timestamped_work_dir_collision(tmp_path, monkeypatch):
+    """Timestamp is taken again if the directory already exists."""
+    cb = CaperBase(local_loc_dir=str(tmp_path / 'loc'))
+    timestamps = iter(
+        [datetime(2020, 1, 1), datetime(2020, 1, 1), datetime(2020, 1, 2)]
+    )
+
+    class MockDatetime:
+        @staticmethod
+        def now():
+            return next(timestamps)
+
+    monkeypatch.setattr(caper_base, 'datetime', MockDatetime)
+
+    work_dir1 = cb.create_timestamped_work_dir()
+    work_dir2 = cb.create_timestamped_work_dir()
+    assert os.path.basename(work_dir1) == '20200101_000000_000000'
+    assert os.path.basename(work_dir2) == '20200102_000000_000000'
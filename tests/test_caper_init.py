@@ -0,0 +1,70 @@
+import os
+
+import pytest
+
+from caper.caper_init import DEFAULT_CONF_CONTENTS, init_caper_conf
+from caper.cromwell import Cromwell
+from caper.cromwell_backend import BACKEND_SLURM
+
+
+@pytest.mark.parametrize('backend', ['gc', 'aw', 'sherlock', ''])
+def test_init_caper_conf_unsupported_backend(tmp_path, backend):
+    conf_file = tmp_path / 'default.conf'
+    with pytest.raises(ValueError):
+        init_caper_conf(str(conf_file), backend)
+    assert not conf_file.exists()
+
+
+@pytest.fixture
+def installed_jars(monkeypatch):
+    monkeypatch.setattr(Cromwell, 'install_cromwell', lambda self: '/cromwell.jar')
+    monkeypatch.setattr(Cromwell, 'install_womtool', lambda self: '/womtool.jar')
+
+
+def test_init_caper_conf_overwrite(tmp_path, installed_jars):
+    """Existing conf file should be replaced and no temporary file left."""
+
+    conf_file = tmp_path / 'default.conf'
+    conf_file.write_text('old contents')
+    conf_file.chmod(0o640)
+    init_caper_conf(str(conf_file), BACKEND_SLURM)
+
+    assert os.listdir(str(tmp_path)) == ['default.conf']
+    contents = conf_file.read_text()
+    assert contents.startswith(DEFAULT_CONF_CONTENTS[BACKEND_SLURM])
+    assert contents.endswith('cromwell=/cromwell.jar\nwomtool=/womtool.jar\n')
+    assert conf_file.stat().st_mode & 0o777 == 0o640
+
+
+def test_init_caper_conf_symlink(tmp_path, installed_jars):
+    """Conf file's symlink should be kept and its target should be updated."""
+    target = tmp_path / 'dotfiles' / 'caper.conf'
+    target.parent.mkdir()
+    target.write_text('old contents')
+    conf_dir = tmp_path / 'caper'
+    conf_dir.mkdir()
+    conf_file = conf_dir / 'default.conf'
+    conf_file.symlink_to(target)
+
+    init_caper_conf(str(conf_file), BACKEND_SLURM)
+
+    assert conf_file.is_symlink()
+    assert os.listdir(str(conf_dir)) == ['default.conf']
+    assert os.listdir(str(target.parent)) == ['caper.conf']
+    assert target.read_text().startswith(DEFAULT_CONF_CONTENTS[BACKEND_SLURM])
+
+
+def test_init_caper_conf_write_failure(tmp_path, installed_jars, monkeypatch):
+    """Temporary file should be removed and conf file kept if writing fails."""
+    conf_file = tmp_path / 'default.conf'
+    conf_file.write_text('old contents')
+
+    def replace(src, dst):
+        raise OSError('replace failed')
+
+    monkeypatch.setattr(os, 'replace', replace)
+    with pytest.raises(OSError):
+        init_caper_conf(str(conf_file), BACKEND_SLURM)
+
+    assert os.listdir(str(tmp_path)) == ['default.conf']
+    assert conf_file.read_text() == 'old contents'
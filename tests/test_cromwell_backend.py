@@ -4,7 +4,15 @@ will be tested.
     - CromwellBackendBase
 
 """
-from caper.cromwell_backend import CromwellBackendBase
+from copy import deepcopy
+
+import pytest
+
+from caper.cromwell_backend import (
+    CromwellBackendAws,
+    CromwellBackendBase,
+    CromwellBackendGcp,
+)
 
 
 def test_cromwell_backend_base_backend():
@@ -40,3 +48,32 @@ def test_cromwell_backend_base_backend_config_dra():
         }
     }
     assert bb1.default_runtime_attributes == {'docker': 'ubuntu:latest'}
+
+
+def test_cromwell_backend_class_template_not_mutated():
+    """Instantiating a backend should not modify class-level templates."""
+    template = deepcopy(CromwellBackendAws.TEMPLATE)
+    template_backend = deepcopy(CromwellBackendAws.TEMPLATE_BACKEND)
+
+    aws = CromwellBackendAws(
+        aws_batch_arn='arn:test', aws_region='us-west-1', aws_out_dir='s3://test'
+    )
+    aws['aws']['auths'].append({'name': 'test', 'scheme': 'test'})
+    aws.backend_config['filesystems']['s3']['auth'] = 'test'
+
+    assert CromwellBackendAws.TEMPLATE == template
+    assert CromwellBackendAws.TEMPLATE_BACKEND == template_backend
+
+
+def test_cromwell_backend_wrong_bucket_uri():
+    """Bucket URI should be validated before reading any key JSON file."""
+    with pytest.raises(ValueError):
+        CromwellBackendGcp(
+            gcp_prj='test-prj',
+            gcp_out_dir='s3://test',
+            gcp_service_account_key_json='/not/existing/key.json',
+        )
+    with pytest.raises(ValueError):
+        CromwellBackendAws(
+            aws_batch_arn='arn:test', aws_region='us-west-1', aws_out_dir='gs://test'
+        )
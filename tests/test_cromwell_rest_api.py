@@ -1,5 +1,9 @@
+import json
 import sys
+import threading
 import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
 
 import pytest
 
@@ -48,6 +52,44 @@ def test_has_wildcard(test_input, expected):
     assert has_wildcard(test_input) == expected
 
 
+def test_connection_reuse():
+    """Multiple requests should reuse a single connection to the server."""
+    client_ports = set()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            client_ports.add(self.client_address[1])
+            body = json.dumps(
+                {'defaultBackend': 'Local', 'supportedBackends': ['Local']}
+            ).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    class Server(ThreadingMixIn, HTTPServer):
+        # do not wait for handlers holding kept-alive connections on shutdown
+        daemon_threads = True
+
+    httpd = Server(('localhost', 0), Handler)
+    th = threading.Thread(target=httpd.serve_forever, daemon=True)
+    th.start()
+    try:
+        cra = CromwellRestAPI(hostname='localhost', port=httpd.server_port)
+        for _ in range(3):
+            assert cra.get_default_backend() == 'Local'
+        assert len(client_ports) == 1
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
 def test_all(tmp_path, cromwell, womtool):
     """Test Cromwell.server() method, which returns a Thread object."""
     server_port = 8010
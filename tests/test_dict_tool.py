@@ -1,6 +1,7 @@
 from textwrap import dedent
 
 from caper.dict_tool import (
+    clone_dict,
     dict_to_dot_str,
     flatten_dict,
     merge_dict,
@@ -35,6 +36,34 @@ def test_merge_dict():
     }
 
 
+def test_merge_dict_deeply_nested():
+    """Deeply nested dicts should be merged without hitting recursion limit."""
+    depth = 5000
+    d1, d2 = {}, {}
+    leaf1, leaf2 = d1, d2
+    for _ in range(depth):
+        leaf1['a'] = {}
+        leaf2['a'] = {}
+        leaf1, leaf2 = leaf1['a'], leaf2['a']
+    leaf1['b'] = 1
+    leaf2['c'] = 2
+
+    merge_dict(d1, d2)
+    for _ in range(depth):
+        d1 = d1['a']
+    assert d1 == {'b': 1, 'c': 2}
+
+
+def test_clone_dict():
+    d = {'a': {'b': [{'c': 1}, 'd']}, 'e': 'f'}
+    d_clone = clone_dict(d)
+    assert d_clone == d
+
+    d_clone['a']['b'][0]['c'] = 2
+    d_clone['a']['b'].append('g')
+    assert d == {'a': {'b': [{'c': 1}, 'd']}, 'e': 'f'}
+
+
 def test_flatten_dict():
     d = {
         'flagstat_qc': {
@@ -38,6 +38,23 @@ def test_properties(tmp_path):
     assert wp.imports == ['sub/sub.wdl']
 
 
+def test_properties_unparsable_wdl(tmp_path, caplog):
+    """WDL is parsed on first access to workflow meta/imports.
+    Imports are still found with regex if miniwdl fails to parse WDL.
+    """
+    contents = 'version 1.0\nimport "sub/sub.wdl" as sub\nworkflow {\n'
+    wdl = tmp_path / 'broken.wdl'
+    wdl.write_text(contents)
+
+    wp = WDLParser(str(wdl))
+    assert wp.contents == contents
+    assert 'Failed to parse WDL' not in caplog.text
+
+    assert wp.workflow_meta is None
+    assert 'Failed to parse WDL' in caplog.text
+    assert wp.imports == ['sub/sub.wdl']
+
+
 def test_zip_subworkflows(tmp_path):
     """This actually tests create_imports_file since
     create_imports_file's merely a wrapper for zip_subworkflows.